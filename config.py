@@ -4,16 +4,42 @@ from __future__ import annotations
 
 import os
 from dataclasses import dataclass
-from typing import Optional
+from functools import lru_cache
+from typing import Mapping, Optional
 
-from dotenv import load_dotenv
 
-load_dotenv()
+@lru_cache(maxsize=None)
+def load_env_file() -> None:
+    """
+    Load variables from a local .env file into os.environ, at most once.
 
+    Called by the CLI before AppConfig.from_env(), which only reads the
+    environment.
+    """
+    from dotenv import load_dotenv
 
-@dataclass
+    load_dotenv()
+
+
+def _as_int(env: Mapping[str, str], key: str, default: int) -> int:
+    """Read an integer from ``env``, skipping the conversion when unset."""
+    value = env.get(key)
+    return int(value) if value is not None else default
+
+
+def _as_float(env: Mapping[str, str], key: str, default: float) -> float:
+    """Read a float from ``env``, skipping the conversion when unset."""
+    value = env.get(key)
+    return float(value) if value is not None else default
+
+
+@dataclass(frozen=True, slots=True)
 class AppConfig:
-    """Application configuration with validation."""
+    """Application configuration with validation.
+
+    Instances are immutable; use ``dataclasses.replace`` to derive an
+    overridden copy (e.g. for CLI flags).
+    """
 
     # API Configuration
     gemini_api_key: str
@@ -58,7 +84,9 @@ class AppConfig:
     @classmethod
     def from_env(cls) -> AppConfig:
         """Create configuration from environment variables."""
-        api_key = os.getenv("GEMINI_API_KEY")
+        env = os.environ
+
+        api_key = env.get("GEMINI_API_KEY")
         if not api_key:
             raise EnvironmentError(
                 "GEMINI_API_KEY is not set.\n"
@@ -71,13 +99,13 @@ class AppConfig:
 
         return cls(
             gemini_api_key=api_key,
-            gemini_model=os.getenv("GEMINI_MODEL", "gemini-1.5-flash"),
-            default_max_results=int(os.getenv("DEFAULT_MAX_RESULTS", "3")),
-            search_max_retries=int(os.getenv("SEARCH_MAX_RETRIES", "3")),
-            search_retry_delay=float(os.getenv("SEARCH_RETRY_DELAY", "1.0")),
-            memory_limit=int(os.getenv("MEMORY_LIMIT", "10")),
-            min_quiz_options=int(os.getenv("MIN_QUIZ_OPTIONS", "2")),
-            max_quiz_options=int(os.getenv("MAX_QUIZ_OPTIONS", "6")),
-            max_input_retries=int(os.getenv("MAX_INPUT_RETRIES", "3")),
+            gemini_model=env.get("GEMINI_MODEL", "gemini-1.5-flash"),
+            default_max_results=_as_int(env, "DEFAULT_MAX_RESULTS", 3),
+            search_max_retries=_as_int(env, "SEARCH_MAX_RETRIES", 3),
+            search_retry_delay=_as_float(env, "SEARCH_RETRY_DELAY", 1.0),
+            memory_limit=_as_int(env, "MEMORY_LIMIT", 10),
+            min_quiz_options=_as_int(env, "MIN_QUIZ_OPTIONS", 2),
+            max_quiz_options=_as_int(env, "MAX_QUIZ_OPTIONS", 6),
+            max_input_retries=_as_int(env, "MAX_INPUT_RETRIES", 3),
         )
 
@@ -2,37 +2,68 @@
 
 from __future__ import annotations
 
-from typing import List, Optional
+from typing import Iterable, List, Optional, Tuple
+
+EMPTY_MEMORY_SECTION = "None yet."
 
 
 def format_agent_prompt(
     agent_name: str,
     instructions: str,
     context: str,
-    memory: Optional[List[str]] = None,
+    memory: Optional[Iterable[str]] = None,
 ) -> str:
     """
     Format a prompt for an agent with memory and context.
 
+    Agents assemble the same prompt from split_agent_prompt() parts cached at
+    construction; this helper builds it in one go.
+
     Args:
         agent_name: Name of the agent (e.g., "Researcher", "QuizMaster")
         instructions: Role-specific instructions for the agent
         context: Current context/input for the agent
-        memory: Optional list of memory entries from previous interactions
+        memory: Optional memory entries from previous interactions
 
     Returns:
         Formatted prompt string
     """
-    memory_section = "\n".join(memory) if memory else "None yet."
+    header, separator, suffix = split_agent_prompt(agent_name, instructions)
+    memory_section = "\n".join(memory) if memory else EMPTY_MEMORY_SECTION
+    return "".join((header, memory_section, separator, context, suffix))
+
+
+def split_agent_prompt(agent_name: str, instructions: str) -> Tuple[str, str, str]:
+    """
+    Split the agent prompt scaffold into its fixed parts.
+
+    The full prompt is ``header + memory_section + separator + context + suffix``.
+
+    Args:
+        agent_name: Name of the agent (e.g., "Researcher", "QuizMaster")
+        instructions: Role-specific instructions for the agent
+
+    Returns:
+        Tuple of (header, separator, suffix)
+    """
+    return format_agent_header(agent_name, instructions), "\n---\nFocused input:\n", "\n"
 
+
+def format_agent_header(agent_name: str, instructions: str) -> str:
+    """
+    Format the fixed leading part of an agent prompt.
+
+    Args:
+        agent_name: Name of the agent (e.g., "Researcher", "QuizMaster")
+        instructions: Role-specific instructions for the agent
+
+    Returns:
+        Prompt header ending right before the memory section
+    """
     return f"""You are the {agent_name} agent.
 Instructions: {instructions}
 
 Session memory (may be empty):
-{memory_section}
----
-Focused input:
-{context}
 """
 
 
@@ -58,18 +89,31 @@ Search digest:
 """
 
 
-def format_quiz_master_prompt(study_note: str) -> str:
+def format_quiz_master_prompt(
+    study_note: str,
+    question_number: Optional[int] = None,
+    total_questions: Optional[int] = None,
+) -> str:
     """
     Format prompt for the Quiz Master agent.
 
     Args:
         study_note: Study note to generate quiz from
+        question_number: Optional position of this question within a batch
+        total_questions: Optional size of the batch being generated
 
     Returns:
         Formatted prompt string
     """
+    batch_hint = ""
+    if question_number and total_questions and total_questions > 1:
+        batch_hint = (
+            f"This is question {question_number} of {total_questions};"
+            " cover a different aspect of the note than the other questions.\n"
+        )
+
     return f"""You must return valid JSON only.
-Study note source:
+{batch_hint}Study note source:
 {study_note}
 """
 
@@ -13,53 +13,131 @@ Run locally:
 from __future__ import annotations
 
 import argparse
+import asyncio
+import atexit
+import dataclasses
 import json
 import logging
+import random
 import re
 import time
-from dataclasses import dataclass
-from typing import List, Optional
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Any, Callable, Deque, Dict, List, Optional, Tuple, Union
 
-from duckduckgo_search import DDGS
-import google.generativeai as genai
+try:  # Optional C-accelerated JSON decoder for quiz payloads
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
 
-from config import AppConfig
+from config import AppConfig, load_env_file
 from prompts import (
-    format_agent_prompt,
+    EMPTY_MEMORY_SECTION,
     format_quiz_master_prompt,
     format_researcher_prompt,
     format_tutor_prompt,
+    split_agent_prompt,
 )
 
 # ----------------------------------------------------------------------------
 # Configuration & logging
 # ----------------------------------------------------------------------------
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(asctime)s | %(levelname)s | %(message)s",
-)
 LOGGER = logging.getLogger("smart-study-buddy")
 
+# Quiz JSON extraction patterns, compiled once at import
+_CODE_BLOCK_RE = re.compile(r"```(?:json)?\s*\n?(.*?)\n?```", re.DOTALL | re.IGNORECASE)
+_JSON_OBJECT_RE = re.compile(r"\{.*\}", re.DOTALL)
+
+# Answer prompt, filled with (attempt, max attempts)
+_ANSWER_PROMPT = "Your answer (number or text, 'q' to quit) [{}/{}]: "
+
+# Study notes kept per session before the oldest topic is evicted
+_NOTE_CACHE_SIZE = 32
+
 # Configuration will be loaded in main() to avoid import-time errors in tests
 
+# Heavy third-party SDKs are imported on first use so that importing this
+# module (e.g. from the test-suite) doesn't pay for their import time.
+DDGS: Any = None
+genai: Any = None
+
+
+def _ddgs_class() -> Any:
+    """Return ``duckduckgo_search.DDGS``, importing it on first use."""
+    global DDGS
+    if DDGS is None:
+        from duckduckgo_search import DDGS as ddgs_class
+
+        DDGS = ddgs_class
+    return DDGS
+
+
+def _genai_module() -> Any:
+    """Return the ``google.generativeai`` module, importing it on first use."""
+    global genai
+    if genai is None:
+        import google.generativeai as genai_module
+
+        genai = genai_module
+    return genai
+
+
+def _loads_json(text: str) -> Any:
+    """
+    Decode JSON, using orjson when it is installed.
+
+    orjson.JSONDecodeError subclasses json.JSONDecodeError, so callers only
+    need to catch the stdlib exception.
+    """
+    if orjson is not None:
+        return orjson.loads(text)
+    return json.loads(text)
+
+
+def _extract_json_blob(text: str) -> Optional[str]:
+    """
+    Extract a JSON object from a response wrapped in markdown or prose.
+
+    Args:
+        text: Raw response text
+
+    Returns:
+        The JSON candidate string, or None if nothing resembling JSON was found
+    """
+    # Match JSON in markdown code blocks (```json ... ``` or ``` ... ```)
+    matches = _CODE_BLOCK_RE.findall(text)
+    if matches:
+        # Use the last match (most likely the actual JSON)
+        return matches[-1].strip()
+
+    # If no code blocks, try to find JSON object boundaries
+    json_match = _JSON_OBJECT_RE.search(text)
+    if json_match:
+        return json_match.group(0).strip()
+    return None
+
 
 # ----------------------------------------------------------------------------
 # Tooling layer
 # ----------------------------------------------------------------------------
-@dataclass
+@dataclass(slots=True)
 class SearchTool:
     """Simple wrapper around DuckDuckGo Search to serve as an agent tool."""
 
     max_results: int
     max_retries: int
     retry_delay: float
+    sleep_fn: Callable[[float], None] = field(default=time.sleep, repr=False)
+    _ddgs: Any = field(default=None, init=False, repr=False)
 
-    def run(self, query: str) -> str:
+    def run(self, query: str, deadline: Optional[float] = None) -> str:
         """
         Execute a web search with retry logic.
 
         Args:
             query: Search query string
+            deadline: Optional time.monotonic() timestamp after which no
+                further retries are attempted
 
         Returns:
             Formatted search results or error message
@@ -70,23 +148,33 @@ class SearchTool:
         LOGGER.info("[Tool] Searching web for '%s' (top %d results)", query, self.max_results)
 
         last_error: Optional[Exception] = None
+        attempt = 0
         for attempt in range(1, self.max_retries + 1):
             try:
-                snippets: List[str] = []
-                with DDGS() as ddgs:
-                    for row in ddgs.text(query, max_results=self.max_results):
-                        body = row.get("body") or ""
-                        title = row.get("title") or "Untitled"
-                        snippets.append(f"- {title}: {body}")
-
-                if snippets:
-                    return "\n".join(snippets)
+                snippets: List[Optional[str]] = [None] * self.max_results
+                count = 0
+                for row in self._client().text(query, max_results=self.max_results):
+                    snippets[count] = f"- {row.get('title') or 'Untitled'}: {row.get('body') or ''}"
+                    count += 1
+                    if count == self.max_results:
+                        break
+
+                if count:
+                    return "\n".join(snippets[:count])
                 return "No public snippets were found."
 
             except (ConnectionError, TimeoutError) as err:
                 last_error = err
                 if attempt < self.max_retries:
-                    wait_time = self.retry_delay * (2 ** (attempt - 1))  # Exponential backoff
+                    # Exponential backoff with up to 10% jitter so concurrent
+                    # clients don't retry in lockstep
+                    base_wait = self.retry_delay * (1 << (attempt - 1))
+                    wait_time = base_wait + random.random() * 0.1 * base_wait
+                    if deadline is not None and time.monotonic() + wait_time > deadline:
+                        LOGGER.error(
+                            "Search deadline reached after %d attempt(s); not retrying", attempt
+                        )
+                        break
                     LOGGER.warning(
                         "Search attempt %d/%d failed: %s. Retrying in %.1f seconds...",
                         attempt,
@@ -94,7 +182,7 @@ class SearchTool:
                         err,
                         wait_time,
                     )
-                    time.sleep(wait_time)
+                    self.sleep_fn(wait_time)
                 else:
                     LOGGER.error("All search attempts failed after %d retries", self.max_retries)
 
@@ -103,37 +191,55 @@ class SearchTool:
                 return f"Search failed: {err}"
 
         # If we get here, all retries failed
-        error_msg = f"Search failed after {self.max_retries} attempts"
+        error_msg = f"Search failed after {attempt} attempts"
         if last_error:
             error_msg += f": {last_error}"
         return error_msg
 
+    def close(self) -> None:
+        """Release the underlying DuckDuckGo client, if one was created."""
+        if self._ddgs is not None:
+            atexit.unregister(self.close)
+            self._ddgs.__exit__(None, None, None)
+            self._ddgs = None
+
+    def _client(self) -> Any:
+        """Return the shared DuckDuckGo client, creating it on first use."""
+        if self._ddgs is None:
+            self._ddgs = _ddgs_class()()
+            atexit.register(self.close)
+        return self._ddgs
+
 
 # ----------------------------------------------------------------------------
 # Base agent abstraction
 # ----------------------------------------------------------------------------
-@dataclass
+@dataclass(slots=True)
 class Agent:
-    """Wrapper around a GenerativeModel with role-specific instructions."""
+    """Role-specific instructions on top of a (possibly shared) GenerativeModel."""
 
     name: str
     instructions: str
-    model_name: str
+    model: Any = field(repr=False)
     response_mime_type: str = "text/plain"
+    # Built in __post_init__
+    _gen_cfg: Dict[str, str] = field(init=False, repr=False)
+    _prefix: str = field(init=False, repr=False)
+    _mid: str = field(init=False, repr=False)
+    _suffix: str = field(init=False, repr=False)
 
     def __post_init__(self) -> None:
-        self._model = genai.GenerativeModel(
-            model_name=self.model_name,
-            generation_config={"response_mime_type": self.response_mime_type},
-        )
+        # Reused on every call; the SDK copies it before merging with model defaults
+        self._gen_cfg = {"response_mime_type": self.response_mime_type}
+        self._prefix, self._mid, self._suffix = split_agent_prompt(self.name, self.instructions)
 
-    def run(self, context: str, memory: Optional[List[str]] = None) -> str:
+    def run(self, context: str, memory_section: Optional[str] = None) -> str:
         """
         Execute the agent with given context and memory.
 
         Args:
             context: Current context/input for the agent
-            memory: Optional list of memory entries from previous interactions
+            memory_section: Newline-joined memory entries from previous interactions
 
         Returns:
             Agent response text
@@ -141,31 +247,67 @@ class Agent:
         Raises:
             Exception: If the agent call fails
         """
-        compiled_prompt = format_agent_prompt(
-            agent_name=self.name,
-            instructions=self.instructions,
-            context=context,
-            memory=memory,
-        )
+        compiled_prompt = self._compile_prompt(context, memory_section)
+
+        try:
+            response = self.model.generate_content(
+                compiled_prompt,
+                generation_config=self._gen_cfg,
+            )
+        except Exception as exc:  # pragma: no cover - SDK surface
+            LOGGER.error("%s agent call failed: %s", self.name, exc)
+            raise
+
+        return (response.text or "").strip()
+
+    async def run_async(self, context: str, memory_section: Optional[str] = None) -> str:
+        """
+        Async variant of run(), so several agent calls can be awaited concurrently.
+
+        Args:
+            context: Current context/input for the agent
+            memory_section: Newline-joined memory entries from previous interactions
+
+        Returns:
+            Agent response text
+
+        Raises:
+            Exception: If the agent call fails
+        """
+        compiled_prompt = self._compile_prompt(context, memory_section)
 
         try:
-            response = self._model.generate_content(compiled_prompt)
+            response = await self.model.generate_content_async(
+                compiled_prompt,
+                generation_config=self._gen_cfg,
+            )
         except Exception as exc:  # pragma: no cover - SDK surface
             LOGGER.error("%s agent call failed: %s", self.name, exc)
             raise
 
         return (response.text or "").strip()
 
+    def _compile_prompt(self, context: str, memory_section: Optional[str]) -> str:
+        """Fill the memory section and context into the cached prompt scaffold."""
+        return "".join(
+            (self._prefix, memory_section or EMPTY_MEMORY_SECTION, self._mid, context, self._suffix)
+        )
+
 
 # ----------------------------------------------------------------------------
 # Pipeline logic
 # ----------------------------------------------------------------------------
-@dataclass
+@dataclass(slots=True)
 class QuizItem:
     question: str
     options: List[str]
     correct_answer: str
     explanation: Optional[str] = None
+    options_lower: Tuple[str, ...] = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        # Lowercased once here so answer matching doesn't redo it per attempt
+        self.options_lower = tuple(option.lower() for option in self.options)
 
 
 class SmartStudyBuddy:
@@ -184,20 +326,27 @@ class SmartStudyBuddy:
             search_tool: Optional search tool instance (uses config defaults if not provided)
         """
         self.config = config
-        self.memory: List[str] = []
+        self.memory: Deque[str] = deque(maxlen=config.memory_limit)
+        # Rolling "\n".join(self.memory), kept in sync by _remember
+        self._memory_section = ""
+        # Session-local study notes keyed by normalized topic
+        self._note_cache: Dict[str, str] = {}
         self.search_tool = search_tool or SearchTool(
             max_results=config.default_max_results,
             max_retries=config.search_max_retries,
             retry_delay=config.search_retry_delay,
         )
 
+        # One client for all agents; each passes its own generation config per call
+        self._model = _genai_module().GenerativeModel(model_name=config.gemini_model)
+
         self.researcher = Agent(
             name="Researcher",
             instructions=(
                 "Aggregate the most important definitions, core principles,"
                 " and real-world examples. Cite search snippets concisely."
             ),
-            model_name=config.gemini_model,
+            model=self._model,
         )
         self.quiz_master = Agent(
             name="QuizMaster",
@@ -206,7 +355,7 @@ class SmartStudyBuddy:
                 " Respond with strict JSON containing keys question, options (list),"
                 " correct_answer, explanation."
             ),
-            model_name=config.gemini_model,
+            model=self._model,
             response_mime_type="application/json",
         )
         self.tutor = Agent(
@@ -215,7 +364,7 @@ class SmartStudyBuddy:
                 "Evaluate the learner's answer, explain correctness, and add a follow-up tip."
                 " Encourage active recall and reference the study note when helpful."
             ),
-            model_name=config.gemini_model,
+            model=self._model,
         )
 
     # --------------------------- public API ---------------------------
@@ -230,9 +379,14 @@ class SmartStudyBuddy:
         study_note = self._generate_study_note(topic)
         LOGGER.info("Study note ready. Generating %d quiz question(s)...", questions)
 
+        # Questions don't depend on earlier answers, so request them all up front
+        prefetched = self._prefetch_quizzes(study_note, questions)
+
         correct = 0
         for idx in range(1, questions + 1):
-            quiz = self._generate_quiz(study_note)
+            quiz = prefetched[idx - 1] or self._generate_quiz(
+                study_note, question_number=idx, total_questions=questions
+            )
             if not quiz:
                 LOGGER.error("Quiz generation failed. Aborting session.")
                 return
@@ -246,7 +400,10 @@ class SmartStudyBuddy:
             if user_answer is None:  # User quit
                 break
 
-            normalized = self._normalize_answer(user_answer, quiz.options)
+            if isinstance(user_answer, int):  # Already-validated option index
+                normalized = quiz.options[user_answer]
+            else:
+                normalized = self._normalize_answer(user_answer, quiz)
             feedback = self._grade_and_feedback(quiz, normalized, study_note)
             print("\nFeedback:\n" + feedback)
 
@@ -267,46 +424,152 @@ class SmartStudyBuddy:
         Args:
             entry: Memory entry to add
         """
+        # The deque's maxlen keeps memory bounded to avoid prompt bloat
+        evicting = len(self.memory) == self.memory.maxlen
         self.memory.append(entry)
-        # Keep memory bounded to avoid prompt bloat
-        if len(self.memory) > self.config.memory_limit:
-            self.memory = self.memory[-self.config.memory_limit :]
+
+        if evicting:
+            self._memory_section = "\n".join(self.memory)
+        elif self._memory_section:
+            self._memory_section += "\n" + entry
+        else:
+            self._memory_section = entry
 
     def _generate_study_note(self, topic: str) -> str:
         """
         Generate a study note for the given topic.
 
+        Notes are cached for the rest of the session, so repeating a topic
+        skips the web search and the Researcher call. The cached note does
+        not reflect memory added since it was generated, which is why the
+        cache is keyed by topic alone.
+
         Args:
             topic: Topic to research
 
         Returns:
             Generated study note
         """
+        key = topic.strip().lower()
+        cached = self._note_cache.get(key)
+        if cached is not None:
+            LOGGER.info("Reusing study note for '%s' from this session.", topic)
+            return cached
+
         search_digest = self.search_tool.run(topic)
         context = format_researcher_prompt(topic=topic, search_digest=search_digest)
 
-        note = self.researcher.run(context, self.memory)
+        note = self.researcher.run(context, self._memory_section)
         self._remember(f"StudyNote::{note}")
+
+        self._note_cache[key] = note
+        if len(self._note_cache) > _NOTE_CACHE_SIZE:
+            # Drop the oldest note; dicts keep insertion order
+            del self._note_cache[next(iter(self._note_cache))]
         return note
 
-    def _generate_quiz(self, study_note: str) -> Optional[QuizItem]:
+    def _generate_quiz(
+        self,
+        study_note: str,
+        question_number: Optional[int] = None,
+        total_questions: Optional[int] = None,
+    ) -> Optional[QuizItem]:
         """
         Generate a quiz question from a study note.
 
         Args:
             study_note: Study note to generate quiz from
+            question_number: Optional position of this question within the session
+            total_questions: Optional number of questions in the session
 
         Returns:
             QuizItem if successful, None otherwise
         """
-        context = format_quiz_master_prompt(study_note=study_note)
+        context = format_quiz_master_prompt(
+            study_note=study_note,
+            question_number=question_number,
+            total_questions=total_questions,
+        )
 
-        raw_response = self.quiz_master.run(context, self.memory)
+        raw_response = self.quiz_master.run(context, self._memory_section)
         quiz = self._parse_quiz(raw_response)
         if quiz:
             self._remember(f"Quiz::{quiz.question}")
         return quiz
 
+    async def _generate_quiz_batch(self, study_note: str, count: int) -> List[Optional[QuizItem]]:
+        """
+        Generate several quiz questions from a study note concurrently.
+
+        Args:
+            study_note: Study note to generate quizzes from
+            count: Number of questions to generate
+
+        Returns:
+            One QuizItem per question, or None where the call or parsing failed
+        """
+        memory_section = self._memory_section
+        responses = await asyncio.gather(
+            *(
+                self.quiz_master.run_async(
+                    format_quiz_master_prompt(
+                        study_note=study_note,
+                        question_number=number,
+                        total_questions=count,
+                    ),
+                    memory_section,
+                )
+                for number in range(1, count + 1)
+            ),
+            return_exceptions=True,
+        )
+
+        # Keep the successful responses; failed slots are regenerated on demand
+        quizzes: List[Optional[QuizItem]] = []
+        for number, response in enumerate(responses, start=1):
+            if isinstance(response, BaseException):
+                LOGGER.warning("Quiz question %d/%d failed: %s", number, count, response)
+                quizzes.append(None)
+                continue
+
+            try:
+                quiz = self._parse_quiz(response)
+            except Exception as exc:
+                LOGGER.warning("Quiz question %d/%d could not be parsed: %s", number, count, exc)
+                quiz = None
+            if quiz:
+                self._remember(f"Quiz::{quiz.question}")
+            quizzes.append(quiz)
+        return quizzes
+
+    def _prefetch_quizzes(self, study_note: str, count: int) -> List[Optional[QuizItem]]:
+        """
+        Generate a batch of quiz questions, falling back to per-question generation.
+
+        Args:
+            study_note: Study note to generate quizzes from
+            count: Number of questions to generate
+
+        Returns:
+            List of length ``count``; None entries are generated on demand
+        """
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            pass
+        else:
+            # asyncio.run() cannot nest inside a running loop.
+            LOGGER.info("Event loop already running; generating questions one at a time.")
+            return [None] * count
+
+        try:
+            return asyncio.run(self._generate_quiz_batch(study_note, count))
+        except Exception as exc:
+            LOGGER.warning(
+                "Batched quiz generation failed: %s. Generating questions one at a time.", exc
+            )
+            return [None] * count
+
     def _grade_and_feedback(
         self, quiz: QuizItem, user_answer: Optional[str], study_note: str
     ) -> str:
@@ -329,11 +592,11 @@ class SmartStudyBuddy:
             study_note=study_note,
         )
 
-        feedback = self.tutor.run(context, self.memory)
+        feedback = self.tutor.run(context, self._memory_section)
         self._remember(f"Feedback::{feedback}")
         return feedback
 
-    def _get_user_answer(self, options: List[str]) -> Optional[str]:
+    def _get_user_answer(self, options: List[str]) -> Optional[Union[int, str]]:
         """
         Get and validate user answer with retry logic.
 
@@ -341,15 +604,15 @@ class SmartStudyBuddy:
             options: List of available answer options
 
         Returns:
-            User's answer string, or None if user quits
+            Zero-based option index for a valid number, the answer text otherwise,
+            or None if user quits
         """
-        for attempt in range(1, self.config.max_input_retries + 1):
-            user_input = input(
-                f"Your answer (number or text, 'q' to quit) [{attempt}/{self.config.max_input_retries}]: "
-            ).strip()
+        max_retries = self.config.max_input_retries
+        for attempt in range(1, max_retries + 1):
+            user_input = input(_ANSWER_PROMPT.format(attempt, max_retries)).strip()
 
             if not user_input:
-                if attempt < self.config.max_input_retries:
+                if attempt < max_retries:
                     print("Please provide an answer or 'q' to quit.")
                     continue
                 else:
@@ -363,9 +626,9 @@ class SmartStudyBuddy:
             if user_input.isdigit():
                 idx = int(user_input) - 1
                 if 0 <= idx < len(options):
-                    return user_input
+                    return idx
                 else:
-                    if attempt < self.config.max_input_retries:
+                    if attempt < max_retries:
                         print(f"Please enter a number between 1 and {len(options)}.")
                         continue
                     else:
@@ -378,13 +641,15 @@ class SmartStudyBuddy:
         return None
 
     @staticmethod
-    def _normalize_answer(user_input: str, options: List[str]) -> Optional[str]:
+    def _normalize_answer(user_input: str, quiz: QuizItem) -> Optional[str]:
         """
-        Normalize user input to match an option.
+        Normalize a free-text answer to match an option.
+
+        Numeric answers are resolved to an option index by _get_user_answer.
 
         Args:
             user_input: Raw user input
-            options: List of available options
+            quiz: Quiz item whose options the input is matched against
 
         Returns:
             Normalized answer matching an option, or original input
@@ -392,14 +657,9 @@ class SmartStudyBuddy:
         if not user_input:
             return None
 
-        if user_input.isdigit():
-            idx = int(user_input) - 1
-            if 0 <= idx < len(options):
-                return options[idx]
-
         user_input_lower = user_input.lower()
-        for option in options:
-            if option.lower().startswith(user_input_lower):
+        for option_lower, option in zip(quiz.options_lower, quiz.options):
+            if option_lower.startswith(user_input_lower):
                 return option
         return user_input  # fallback to raw text
 
@@ -417,27 +677,26 @@ class SmartStudyBuddy:
         if not payload:
             return None
 
-        # Step 1: Extract JSON from markdown code blocks using regex
+        # Step 1: Fast path for bare JSON (the usual application/json response)
         cleaned = payload.strip()
+        data: Any = None
+        if cleaned.startswith("{") and cleaned.endswith("}"):
+            try:
+                data = _loads_json(cleaned)
+            except json.JSONDecodeError:
+                data = None
 
-        # Match JSON in markdown code blocks (```json ... ``` or ``` ... ```)
-        code_block_pattern = r"```(?:json)?\s*\n?(.*?)\n?```"
-        matches = re.findall(code_block_pattern, cleaned, re.DOTALL | re.IGNORECASE)
-        if matches:
-            # Use the last match (most likely the actual JSON)
-            cleaned = matches[-1].strip()
-        else:
-            # If no code blocks, try to find JSON object boundaries
-            json_pattern = r"\{.*\}"
-            json_match = re.search(json_pattern, cleaned, re.DOTALL)
-            if json_match:
-                cleaned = json_match.group(0).strip()
+        # Step 2: Otherwise pull the JSON out of code fences or surrounding prose
+        if data is None:
+            blob = _extract_json_blob(cleaned)
+            try:
+                data = _loads_json(blob if blob is not None else cleaned)
+            except json.JSONDecodeError as exc:
+                LOGGER.error("Quiz JSON parsing failed: %s\nPayload was:\n%s", exc, payload)
+                return None
 
-        # Step 2: Parse JSON
-        try:
-            data = json.loads(cleaned)
-        except json.JSONDecodeError as exc:
-            LOGGER.error("Quiz JSON parsing failed: %s\nPayload was:\n%s", exc, payload)
+        if not isinstance(data, dict):
+            LOGGER.error("Quiz JSON must be an object: %s", data)
             return None
 
         # Step 3: Validate and extract fields
@@ -459,6 +718,12 @@ class SmartStudyBuddy:
             LOGGER.error("Quiz JSON 'options' must have at least 2 items: %s", data)
             return None
 
+        # Numbers are fine as option labels; null or nested values are not
+        if not all(isinstance(option, (str, int, float)) for option in options):
+            LOGGER.error("Quiz JSON 'options' must be strings or numbers: %s", data)
+            return None
+        options = [str(option) for option in options]
+
         if not answer or not isinstance(answer, str):
             LOGGER.error("Quiz JSON missing or invalid 'correct_answer' field: %s", data)
             return None
@@ -482,6 +747,31 @@ class SmartStudyBuddy:
 # ----------------------------------------------------------------------------
 # CLI entrypoint
 # ----------------------------------------------------------------------------
+def configure_logging(verbose: bool = False) -> None:
+    """
+    Configure root logging for the CLI.
+
+    Timestamps and third-party debug chatter are only kept in verbose mode;
+    the default format skips the per-record asctime formatting.
+
+    Args:
+        verbose: Whether to include timestamps and library log output
+    """
+    # These record attributes are never rendered, so skip collecting them
+    logging.logThreads = False
+    logging.logProcesses = False
+    logging.logMultiprocessing = False
+
+    if verbose:
+        logging.basicConfig(
+            level=logging.INFO,
+            format="%(asctime)s | %(levelname)s | %(message)s",
+        )
+    else:
+        logging.basicConfig(level=logging.INFO, format="%(levelname)s | %(message)s")
+        logging.getLogger("duckduckgo_search").setLevel(logging.WARNING)
+
+
 def parse_args() -> argparse.Namespace:
     parser = argparse.ArgumentParser(description="Run the Smart Study Buddy agent.")
     parser.add_argument("--topic", "-t", help="Topic to study. If omitted you'll be prompted.")
@@ -492,12 +782,22 @@ def parse_args() -> argparse.Namespace:
         default=3,
         help="How many search results to fetch for grounding context.",
     )
+    parser.add_argument(
+        "--verbose",
+        "-v",
+        action="store_true",
+        help="Include timestamps and third-party library logs in the output.",
+    )
     return parser.parse_args()
 
 
 def main() -> None:
     """Main entry point for the CLI."""
+    args = parse_args()
+    configure_logging(verbose=args.verbose)
+
     # Load configuration (only when actually running, not during import)
+    load_env_file()
     try:
         config = AppConfig.from_env()
     except EnvironmentError as e:
@@ -505,16 +805,15 @@ def main() -> None:
         raise
 
     # Configure Gemini API
-    genai.configure(api_key=config.gemini_api_key)
+    _genai_module().configure(api_key=config.gemini_api_key)
 
-    args = parse_args()
     topic = args.topic or input("Enter a topic to study: ").strip()
     if not topic:
         raise ValueError("A topic is required to run the study buddy.")
 
     # Override config with CLI arguments if provided
     if args.max_results:
-        config.default_max_results = args.max_results
+        config = dataclasses.replace(config, default_max_results=args.max_results)
 
     search_tool = SearchTool(
         max_results=config.default_max_results,
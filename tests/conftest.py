@@ -0,0 +1,22 @@
+"""Shared pytest configuration for Smart Study Buddy tests."""
+
+from unittest.mock import MagicMock
+
+import pytest
+
+import smart_study_buddy
+
+
+@pytest.fixture(scope="session", autouse=True)
+def stub_heavy_sdks():
+    """
+    Stand in for the lazily imported Gemini and DuckDuckGo SDKs.
+
+    smart_study_buddy only imports them on first use, so pre-filling its
+    module globals means no test pays their import time or touches the network.
+    Tests that need specific behaviour still patch ``DDGS`` or pass their own models.
+    """
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(smart_study_buddy, "genai", MagicMock(name="genai"))
+        mp.setattr(smart_study_buddy, "DDGS", MagicMock(name="DDGS"))
+        yield
@@ -1,5 +1,6 @@
 """Tests for configuration management."""
 
+import dataclasses
 import os
 from unittest.mock import patch
 
@@ -26,6 +27,30 @@ class TestAppConfig:
             assert config.default_max_results == 3
             assert config.memory_limit == 10
 
+    def test_from_env_numeric_overrides(self):
+        """Test that numeric settings are parsed from environment variables."""
+        with patch.dict(
+            os.environ,
+            {
+                "GEMINI_API_KEY": "test-key-123",
+                "DEFAULT_MAX_RESULTS": "5",
+                "MEMORY_LIMIT": "4",
+                "SEARCH_RETRY_DELAY": "0.5",
+            },
+        ):
+            config = AppConfig.from_env()
+            assert config.default_max_results == 5
+            assert config.memory_limit == 4
+            assert config.search_retry_delay == 0.5
+            assert config.search_max_retries == 3
+
+    def test_from_env_does_not_load_env_file(self):
+        """Test that from_env only reads the environment; main() loads .env."""
+        with patch("dotenv.load_dotenv") as mock_load_dotenv:
+            with patch.dict(os.environ, {"GEMINI_API_KEY": "test-key-123"}):
+                AppConfig.from_env()
+        mock_load_dotenv.assert_not_called()
+
     def test_from_env_missing_api_key(self):
         """Test that missing API key raises EnvironmentError."""
         with patch.dict(os.environ, {}, clear=True):
@@ -63,6 +88,16 @@ class TestAppConfig:
         with pytest.raises(ValueError, match="max_quiz_options must be >= min_quiz_options"):
             AppConfig(gemini_api_key="test-key", min_quiz_options=5, max_quiz_options=3)
 
+    def test_config_is_immutable(self):
+        """Test that configuration cannot be mutated after construction."""
+        config = AppConfig(gemini_api_key="test-key")
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            config.memory_limit = 3
+
+        updated = dataclasses.replace(config, memory_limit=3)
+        assert updated.memory_limit == 3
+        assert config.memory_limit == 10
+
     def test_default_values(self):
         """Test that default values are set correctly."""
         config = AppConfig(gemini_api_key="test-key")
@@ -1,10 +1,12 @@
 """Tests for prompt templates."""
 
 from prompts import (
+    format_agent_header,
     format_agent_prompt,
     format_quiz_master_prompt,
     format_researcher_prompt,
     format_tutor_prompt,
+    split_agent_prompt,
 )
 
 
@@ -36,6 +38,29 @@ class TestPromptTemplates:
         assert "TestAgent" in prompt
         assert "None yet." in prompt
 
+    def test_format_agent_header(self):
+        """Test that the agent header is the fixed prefix of the full prompt."""
+        header = format_agent_header(agent_name="TestAgent", instructions="Do something")
+        prompt = format_agent_prompt(
+            agent_name="TestAgent",
+            instructions="Do something",
+            context="Test context",
+            memory=["Memory 1"],
+        )
+        assert prompt.startswith(header)
+        assert prompt[len(header):].startswith("Memory 1")
+
+    def test_split_agent_prompt(self):
+        """Test that the split scaffold reassembles into the full prompt."""
+        header, separator, suffix = split_agent_prompt("TestAgent", "Do something")
+        prompt = format_agent_prompt(
+            agent_name="TestAgent",
+            instructions="Do something",
+            context="Test context",
+            memory=["Memory 1", "Memory 2"],
+        )
+        assert prompt == header + "Memory 1\nMemory 2" + separator + "Test context" + suffix
+
     def test_format_researcher_prompt(self):
         """Test researcher prompt formatting."""
         prompt = format_researcher_prompt(
@@ -51,6 +76,16 @@ class TestPromptTemplates:
         assert "Study note content" in prompt
         assert "JSON" in prompt
 
+    def test_format_quiz_master_prompt_batch_hint(self):
+        """Test quiz master prompt mentions its position within a batch."""
+        prompt = format_quiz_master_prompt(
+            study_note="Study note content",
+            question_number=2,
+            total_questions=3,
+        )
+        assert "question 2 of 3" in prompt
+        assert "question" not in format_quiz_master_prompt(study_note="Note")
+
     def test_format_tutor_prompt(self):
         """Test tutor prompt formatting."""
         prompt = format_tutor_prompt(
@@ -1,93 +1,211 @@
 """Tests for Smart Study Buddy core functionality."""
 
-import json
-from unittest.mock import MagicMock, Mock, patch
+import asyncio
+import dataclasses
+import subprocess
+import sys
+import time
+from pathlib import Path
+from unittest.mock import AsyncMock, MagicMock, Mock, create_autospec, patch
 
 import pytest
 
 from config import AppConfig
-from smart_study_buddy import QuizItem, SearchTool, SmartStudyBuddy
+from smart_study_buddy import Agent, QuizItem, SearchTool, SmartStudyBuddy, _extract_json_blob
 
 
+@pytest.fixture
+def sleeps():
+    """Collect the retry delays a SearchTool requests instead of sleeping."""
+    return []
+
+
+@pytest.fixture
+def make_search_tool(sleeps):
+    """Build SearchTools whose retry delays are recorded, never slept; closed on teardown."""
+    tools = []
+
+    def _make(max_results=3, max_retries=1, retry_delay=0.1):
+        tool = SearchTool(
+            max_results=max_results,
+            max_retries=max_retries,
+            retry_delay=retry_delay,
+            sleep_fn=sleeps.append,
+        )
+        tools.append(tool)
+        return tool
+
+    yield _make
+    # Closing unregisters each tool's atexit hook so it can be garbage collected
+    for tool in tools:
+        tool.close()
+
+
+@pytest.fixture(scope="module")
+def _ddgs_client():
+    """Module-wide DuckDuckGo client mock; per-test state is reset after each use."""
+    return MagicMock()
+
+
+@pytest.fixture
+def ddgs_mock(_ddgs_client):
+    """DuckDuckGo client mock; tests set ``text.return_value`` or ``side_effect``."""
+    yield _ddgs_client
+    _ddgs_client.reset_mock(return_value=True, side_effect=True)
+
+
+@pytest.fixture
+def ddgs_cls(mocker, ddgs_mock):
+    """Patch the DuckDuckGo client class used by SearchTool to return ``ddgs_mock``."""
+    return mocker.patch("smart_study_buddy.DDGS", return_value=ddgs_mock)
+
+
+@pytest.fixture
+def agent_cls(mocker):
+    """Patch the Agent class used by SmartStudyBuddy."""
+    return mocker.patch("smart_study_buddy.Agent")
+
+
+@pytest.mark.usefixtures("ddgs_cls")
 class TestSearchTool:
     """Test SearchTool class."""
 
-    @patch("smart_study_buddy.DDGS")
-    def test_search_success(self, mock_ddgs_class):
+    def test_search_success(self, ddgs_mock, make_search_tool):
         """Test successful search."""
-        mock_ddgs = MagicMock()
-        mock_ddgs.__enter__.return_value = mock_ddgs
-        mock_ddgs.text.return_value = [
+        ddgs_mock.text.return_value = [
             {"title": "Test Title", "body": "Test body"},
             {"title": "Another Title", "body": "Another body"},
         ]
-        mock_ddgs_class.return_value = mock_ddgs
 
-        tool = SearchTool(max_results=2, max_retries=1, retry_delay=0.1)
+        tool = make_search_tool(max_results=2)
         result = tool.run("test query")
 
         assert "Test Title" in result
         assert "Test body" in result
         assert "Another Title" in result
 
-    def test_search_empty_query(self):
+    def test_search_reuses_client(self, ddgs_cls, ddgs_mock, make_search_tool):
+        """Test that one DuckDuckGo client is shared across searches until closed."""
+        ddgs_mock.text.return_value = [{"title": "T", "body": "B"}]
+
+        tool = make_search_tool(max_results=1)
+        tool.run("first query")
+        tool.run("second query")
+        assert ddgs_cls.call_count == 1
+
+        tool.close()
+        ddgs_mock.__exit__.assert_called_once_with(None, None, None)
+        tool.run("third query")
+        assert ddgs_cls.call_count == 2
+
+    def test_search_caps_results(self, ddgs_mock, make_search_tool):
+        """Test that at most max_results snippets are returned."""
+        ddgs_mock.text.return_value = [
+            {"title": f"Title {i}", "body": None} for i in range(5)
+        ]
+
+        tool = make_search_tool(max_results=2)
+        result = tool.run("test query")
+
+        assert result == "- Title 0: \n- Title 1: "
+
+    def test_search_empty_query(self, make_search_tool):
         """Test search with empty query."""
-        tool = SearchTool(max_results=3, max_retries=1, retry_delay=0.1)
+        tool = make_search_tool()
         result = tool.run("")
         assert result == "No query provided."
 
-    @patch("smart_study_buddy.DDGS")
-    @patch("smart_study_buddy.time.sleep")
-    def test_search_retry_on_connection_error(self, mock_sleep, mock_ddgs_class):
+    def test_search_retry_on_connection_error(self, ddgs_mock, make_search_tool, sleeps):
         """Test search retry logic on connection error."""
-        mock_ddgs = MagicMock()
-        mock_ddgs.__enter__.return_value = mock_ddgs
-        mock_ddgs.text.side_effect = [
+        ddgs_mock.text.side_effect = [
             ConnectionError("Connection failed"),
             [{"title": "Success", "body": "Success body"}],
         ]
-        mock_ddgs_class.return_value = mock_ddgs
 
-        tool = SearchTool(max_results=3, max_retries=2, retry_delay=0.1)
+        tool = make_search_tool(max_retries=2)
         result = tool.run("test query")
 
         assert "Success" in result
-        assert mock_sleep.called  # Verify retry delay was called
+        assert len(sleeps) == 1  # Verify retry delay was requested
+        assert 0.1 <= sleeps[0] <= 0.11  # Base delay plus at most 10% jitter
 
-    @patch("smart_study_buddy.DDGS")
-    def test_search_no_results(self, mock_ddgs_class):
-        """Test search with no results."""
-        mock_ddgs = MagicMock()
-        mock_ddgs.__enter__.return_value = mock_ddgs
-        mock_ddgs.text.return_value = []
-        mock_ddgs_class.return_value = mock_ddgs
+    def test_search_backoff_follows_mutated_fields(self, ddgs_mock, make_search_tool, sleeps):
+        """Test that changing retry settings after construction updates the backoff."""
+        ddgs_mock.text.side_effect = ConnectionError("Connection failed")
 
-        tool = SearchTool(max_results=3, max_retries=1, retry_delay=0.1)
+        tool = make_search_tool(max_retries=2)
+        tool.max_retries = 4
+        tool.retry_delay = 1.0
         result = tool.run("test query")
 
-        assert "No public snippets were found." in result
+        assert result == "Search failed after 4 attempts: Connection failed"
+        assert len(sleeps) == 3
+        for base, slept in zip((1.0, 2.0, 4.0), sleeps):
+            assert base <= slept <= base * 1.1
 
+    def test_search_stops_retrying_past_deadline(self, ddgs_mock, make_search_tool, sleeps):
+        """Test that no retry is attempted when it would overrun the deadline."""
+        ddgs_mock.text.side_effect = ConnectionError("Connection failed")
 
-class TestQuizParsing:
-    """Test quiz parsing functionality."""
+        tool = make_search_tool(max_retries=3, retry_delay=10.0)
+        result = tool.run("test query", deadline=time.monotonic() + 1.0)
 
-    def test_parse_quiz_valid_json(self):
-        """Test parsing valid JSON quiz."""
-        payload = json.dumps({
-            "question": "What is 2+2?",
-            "options": ["3", "4", "5", "6"],
-            "correct_answer": "4",
-            "explanation": "Basic math",
-        })
-        quiz = SmartStudyBuddy._parse_quiz(payload)
-        assert quiz is not None
-        assert quiz.question == "What is 2+2?"
-        assert quiz.options == ["3", "4", "5", "6"]
-        assert quiz.correct_answer == "4"
+        assert result == "Search failed after 1 attempts: Connection failed"
+        assert sleeps == []
+
+    def test_search_no_results(self, ddgs_mock, make_search_tool):
+        """Test search with no results."""
+        ddgs_mock.text.return_value = []
+
+        tool = make_search_tool()
+        result = tool.run("test query")
 
-    def test_parse_quiz_markdown_code_block(self):
-        """Test parsing quiz from markdown code block."""
-        payload = """Here's the quiz:
+        assert "No public snippets were found." in result
+
+
+class TestAgent:
+    """Test Agent class."""
+
+    def test_run_passes_generation_config(self):
+        """Test that the agent sends its prompt and MIME type to the model."""
+        model = Mock()
+        model.generate_content.return_value.text = "  Answer  "
+        agent = Agent(
+            name="Tester",
+            instructions="Be brief",
+            model=model,
+            response_mime_type="application/json",
+        )
+
+        assert agent.run("Some context", "Entry 1") == "Answer"
+        prompt = model.generate_content.call_args.args[0]
+        assert "Tester" in prompt
+        assert "Entry 1" in prompt
+        assert "Some context" in prompt
+        assert model.generate_content.call_args.kwargs["generation_config"] == {
+            "response_mime_type": "application/json"
+        }
+
+
+# Quiz payloads as literal JSON, so no test re-serializes them
+_VALID_QUIZ_JSON = (
+    '{"question": "What is 2+2?", "options": ["3", "4", "5", "6"],'
+    ' "correct_answer": "4", "explanation": "Basic math"}'
+)
+_MISSING_FIELDS_JSON = '{"question": "Test?"}'
+_SINGLE_OPTION_JSON = '{"question": "Test?", "options": ["Only one"], "correct_answer": "Only one"}'
+_NUMERIC_OPTIONS_JSON = '{"question": "2+2?", "options": [3, 4, 5], "correct_answer": "4"}'
+_NULL_OPTION_JSON = '{"question": "Pick one", "options": ["a", null], "correct_answer": "a"}'
+_ANSWER_NOT_IN_OPTIONS_JSON = '{"question": "Test?", "options": ["A", "B"], "correct_answer": "C"}'
+
+PARSE_QUIZ_CASES = [
+    pytest.param(
+        _VALID_QUIZ_JSON,
+        {"question": "What is 2+2?", "options": ["3", "4", "5", "6"], "correct_answer": "4"},
+        id="valid_json",
+    ),
+    pytest.param(
+        """Here's the quiz:
 ```json
 {
   "question": "What is X?",
@@ -95,100 +213,106 @@ class TestQuizParsing:
   "correct_answer": "A"
 }
 ```
-Some extra text."""
-        quiz = SmartStudyBuddy._parse_quiz(payload)
-        assert quiz is not None
-        assert quiz.question == "What is X?"
+Some extra text.""",
+        {"question": "What is X?"},
+        id="markdown_code_block",
+    ),
+    pytest.param(_MISSING_FIELDS_JSON, None, id="missing_fields"),
+    pytest.param(_SINGLE_OPTION_JSON, None, id="invalid_options"),
+    pytest.param(
+        _ANSWER_NOT_IN_OPTIONS_JSON,
+        {"correct_answer": "A"},  # Falls back to the first option
+        id="answer_not_in_options",
+    ),
+    pytest.param(
+        _NUMERIC_OPTIONS_JSON,
+        {"options": ["3", "4", "5"], "correct_answer": "4"},
+        id="numeric_options",
+    ),
+    pytest.param(_NULL_OPTION_JSON, None, id="null_option"),
+    pytest.param("[1, 2]", None, id="non_object_json"),
+    pytest.param("", None, id="empty_payload"),
+    pytest.param("This is not JSON {", None, id="invalid_json"),
+]
+
+NORMALIZE_CASES = [
+    pytest.param("Banana", ["Apple", "Banana", "Cherry"], "Banana", id="exact_match"),
+    pytest.param("ban", ["Apple", "Banana", "Cherry"], "Banana", id="prefix_match"),
+    pytest.param("", ["Apple", "Banana"], None, id="empty_answer"),
+    pytest.param("99", ["Apple", "Banana"], "99", id="invalid_number_as_text"),
+]
 
-    def test_parse_quiz_missing_fields(self):
-        """Test parsing quiz with missing required fields."""
-        payload = json.dumps({"question": "Test?"})
-        quiz = SmartStudyBuddy._parse_quiz(payload)
-        assert quiz is None
-
-    def test_parse_quiz_invalid_options(self):
-        """Test parsing quiz with invalid options."""
-        payload = json.dumps({
-            "question": "Test?",
-            "options": ["Only one"],
-            "correct_answer": "Only one",
-        })
-        quiz = SmartStudyBuddy._parse_quiz(payload)
-        assert quiz is None
-
-    def test_parse_quiz_answer_not_in_options(self):
-        """Test parsing quiz where answer is not in options."""
-        payload = json.dumps({
-            "question": "Test?",
-            "options": ["A", "B"],
-            "correct_answer": "C",
-        })
-        quiz = SmartStudyBuddy._parse_quiz(payload)
-        # Should fallback to first option
-        assert quiz is not None
-        assert quiz.correct_answer == "A"
 
-    def test_parse_quiz_empty_payload(self):
-        """Test parsing empty payload."""
-        quiz = SmartStudyBuddy._parse_quiz("")
-        assert quiz is None
+class TestQuizParsing:
+    """Test quiz parsing functionality."""
 
-    def test_parse_quiz_invalid_json(self):
-        """Test parsing invalid JSON."""
-        payload = "This is not JSON {"
+    @pytest.mark.parametrize("payload,expected", PARSE_QUIZ_CASES)
+    def test_parse_quiz(self, payload, expected):
+        """Test parsing quiz payloads; expected is None or the fields to check."""
         quiz = SmartStudyBuddy._parse_quiz(payload)
-        assert quiz is None
+        if expected is None:
+            assert quiz is None
+        else:
+            assert quiz is not None
+            for name, value in expected.items():
+                assert getattr(quiz, name) == value
+
+    def test_extract_json_blob(self):
+        """Test extracting JSON from fenced and prose-wrapped responses."""
+        assert _extract_json_blob('Quiz:\n```json\n{"a": 1}\n```') == '{"a": 1}'
+        assert _extract_json_blob('Sure! {"a": 1} Enjoy.') == '{"a": 1}'
+        assert _extract_json_blob("No JSON here") is None
+
+    @patch("smart_study_buddy.orjson", None)
+    def test_parse_quiz_without_orjson(self):
+        """Test parsing falls back to the stdlib decoder when orjson is missing."""
+        quiz = SmartStudyBuddy._parse_quiz(_VALID_QUIZ_JSON)
+        assert quiz is not None
+        assert quiz.correct_answer == "4"
+        assert SmartStudyBuddy._parse_quiz("{not json}") is None
 
 
 class TestAnswerNormalization:
     """Test answer normalization."""
 
-    def test_normalize_numeric_answer(self):
-        """Test normalizing numeric answer."""
-        options = ["Apple", "Banana", "Cherry"]
-        result = SmartStudyBuddy._normalize_answer("2", options)
-        assert result == "Banana"
-
-    def test_normalize_text_answer_exact_match(self):
-        """Test normalizing text answer with exact match."""
-        options = ["Apple", "Banana", "Cherry"]
-        result = SmartStudyBuddy._normalize_answer("Banana", options)
-        assert result == "Banana"
-
-    def test_normalize_text_answer_prefix_match(self):
-        """Test normalizing text answer with prefix match."""
-        options = ["Apple", "Banana", "Cherry"]
-        result = SmartStudyBuddy._normalize_answer("ban", options)
-        assert result == "Banana"
-
-    def test_normalize_empty_answer(self):
-        """Test normalizing empty answer."""
-        options = ["Apple", "Banana"]
-        result = SmartStudyBuddy._normalize_answer("", options)
-        assert result is None
-
-    def test_normalize_invalid_number(self):
-        """Test normalizing invalid number."""
-        options = ["Apple", "Banana"]
-        result = SmartStudyBuddy._normalize_answer("99", options)
-        assert result == "99"  # Falls back to raw text
+    @patch("builtins.input", return_value="2")
+    def test_numeric_answer_returns_index(self, mock_input):
+        """Test that a valid numeric answer is returned as an option index."""
+        buddy = SmartStudyBuddy(
+            config=AppConfig(gemini_api_key="test-key"),
+            search_tool=create_autospec(SearchTool, instance=True, spec_set=True),
+        )
+        result = buddy._get_user_answer(["Apple", "Banana", "Cherry"])
+        assert result == 1
+        mock_input.assert_called_once_with("Your answer (number or text, 'q' to quit) [1/3]: ")
+
+    @pytest.mark.parametrize("answer,options,expected", NORMALIZE_CASES)
+    def test_normalize_answer(self, answer, options, expected):
+        """Test normalizing text answers against the quiz options."""
+        quiz = QuizItem(question="Pick one", options=options, correct_answer=options[0])
+        assert SmartStudyBuddy._normalize_answer(answer, quiz) == expected
 
 
 class TestSmartStudyBuddy:
     """Test SmartStudyBuddy class."""
 
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def config(self):
-        """Create a test configuration."""
+        """Create a test configuration (immutable, so shared by the module)."""
         return AppConfig(gemini_api_key="test-key")
 
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def mock_search_tool(self):
-        """Create a mock search tool."""
-        tool = Mock(spec=SearchTool)
+        """Create a mock search tool shared by the module."""
+        tool = create_autospec(SearchTool, instance=True, spec_set=True)
         tool.run.return_value = "Test search results"
         return tool
 
+    @pytest.fixture(autouse=True)
+    def reset_search_tool(self, mock_search_tool):
+        """Clear the shared search tool's call history between tests."""
+        mock_search_tool.reset_mock()
+
     def test_remember_within_limit(self, config, mock_search_tool):
         """Test memory management within limit."""
         buddy = SmartStudyBuddy(config=config, search_tool=mock_search_tool)
@@ -198,19 +322,27 @@ class TestSmartStudyBuddy:
 
     def test_remember_exceeds_limit(self, config, mock_search_tool):
         """Test memory management when exceeding limit."""
+        config = dataclasses.replace(config, memory_limit=3)
         buddy = SmartStudyBuddy(config=config, search_tool=mock_search_tool)
-        config.memory_limit = 3
         for i in range(5):
             buddy._remember(f"Entry {i}")
         assert len(buddy.memory) == 3
         assert buddy.memory[0] == "Entry 2"  # First two should be removed
 
-    @patch("smart_study_buddy.Agent")
-    def test_generate_study_note(self, mock_agent_class, config, mock_search_tool):
+    def test_memory_section_tracks_memory(self, config, mock_search_tool):
+        """Test that the cached memory section matches the memory entries."""
+        config = dataclasses.replace(config, memory_limit=2)
+        buddy = SmartStudyBuddy(config=config, search_tool=mock_search_tool)
+        assert buddy._memory_section == ""
+        for i in range(3):
+            buddy._remember(f"Entry {i}")
+            assert buddy._memory_section == "\n".join(buddy.memory)
+
+    def test_generate_study_note(self, agent_cls, config, mock_search_tool):
         """Test study note generation."""
         mock_agent = Mock()
         mock_agent.run.return_value = "Generated study note"
-        mock_agent_class.return_value = mock_agent
+        agent_cls.return_value = mock_agent
 
         buddy = SmartStudyBuddy(config=config, search_tool=mock_search_tool)
         buddy.researcher = mock_agent
@@ -220,3 +352,146 @@ class TestSmartStudyBuddy:
         assert len(buddy.memory) == 1
         assert "StudyNote::" in buddy.memory[0]
 
+    def test_agents_share_model(self, config, mock_search_tool):
+        """Test that all agents reuse a single GenerativeModel."""
+        buddy = SmartStudyBuddy(config=config, search_tool=mock_search_tool)
+        assert buddy.researcher.model is buddy.quiz_master.model is buddy.tutor.model
+
+    def test_generate_study_note_cached_per_topic(self, config, mock_search_tool):
+        """Test that repeating a topic reuses the session's study note."""
+        buddy = SmartStudyBuddy(config=config, search_tool=mock_search_tool)
+        buddy.researcher = Mock()
+        buddy.researcher.run.return_value = "Generated study note"
+
+        first = buddy._generate_study_note("Test Topic")
+        second = buddy._generate_study_note("  test topic ")
+        assert first == second == "Generated study note"
+        assert mock_search_tool.run.call_count == 1
+        assert buddy.researcher.run.call_count == 1
+        assert len(buddy.memory) == 1
+
+    def test_generate_quiz_batch(self, config, mock_search_tool):
+        """Test concurrent quiz generation parses and remembers each question."""
+        buddy = SmartStudyBuddy(config=config, search_tool=mock_search_tool)
+        buddy.quiz_master = Mock()
+        buddy.quiz_master.run_async = AsyncMock(
+            side_effect=[
+                '{"question": "Q1?", "options": ["A", "B"], "correct_answer": "A"}',
+                "not json",
+            ]
+        )
+
+        quizzes = buddy._prefetch_quizzes("Study note", 2)
+        assert quizzes[0].question == "Q1?"
+        assert quizzes[1] is None
+        assert buddy.quiz_master.run_async.await_count == 2
+        assert list(buddy.memory) == ["Quiz::Q1?"]
+
+    def test_generate_quiz_batch_keeps_successes(self, config, mock_search_tool):
+        """Test that one failed call only leaves its own slot to be regenerated."""
+        buddy = SmartStudyBuddy(config=config, search_tool=mock_search_tool)
+        buddy.quiz_master = Mock()
+        buddy.quiz_master.run_async = AsyncMock(
+            side_effect=[_VALID_QUIZ_JSON, RuntimeError("429"), _VALID_QUIZ_JSON]
+        )
+
+        quizzes = buddy._prefetch_quizzes("Study note", 3)
+        assert [quiz is not None for quiz in quizzes] == [True, False, True]
+        assert buddy.quiz_master.run_async.await_count == 3
+
+    def test_generate_quiz_batch_isolates_parse_failures(self, config, mock_search_tool):
+        """Test that a reply that fails to parse only empties its own slot."""
+        buddy = SmartStudyBuddy(config=config, search_tool=mock_search_tool)
+        buddy.quiz_master = Mock()
+        buddy.quiz_master.run_async = AsyncMock(
+            side_effect=[_VALID_QUIZ_JSON, "[1, 2]", _VALID_QUIZ_JSON]
+        )
+
+        quizzes = buddy._prefetch_quizzes("Study note", 3)
+        assert [quiz is not None for quiz in quizzes] == [True, False, True]
+
+        buddy.quiz_master.run_async.side_effect = [_VALID_QUIZ_JSON] * 3
+        parse = SmartStudyBuddy._parse_quiz
+        with patch.object(
+            SmartStudyBuddy,
+            "_parse_quiz",
+            side_effect=[parse(_VALID_QUIZ_JSON), ValueError("bad"), parse(_VALID_QUIZ_JSON)],
+        ):
+            quizzes = buddy._prefetch_quizzes("Study note", 3)
+        assert [quiz is not None for quiz in quizzes] == [True, False, True]
+
+    def test_generate_quiz_passes_batch_hint(self, config, mock_search_tool):
+        """Test that on-demand regeneration keeps the question's position hint."""
+        buddy = SmartStudyBuddy(config=config, search_tool=mock_search_tool)
+        buddy.quiz_master = Mock()
+        buddy.quiz_master.run.return_value = _VALID_QUIZ_JSON
+
+        quiz = buddy._generate_quiz("Study note", question_number=2, total_questions=3)
+        assert quiz is not None
+        assert "question 2 of 3" in buddy.quiz_master.run.call_args.args[0]
+
+    def test_prefetch_quizzes_falls_back_on_error(self, config, mock_search_tool, caplog):
+        """Test that a batch that fails outright leaves every question to be generated on demand."""
+        buddy = SmartStudyBuddy(config=config, search_tool=mock_search_tool)
+        buddy.quiz_master = Mock()
+        # Raising before an awaitable exists fails the batch itself, not a single slot
+        buddy.quiz_master.run_async = Mock(side_effect=RuntimeError("boom"))
+
+        assert buddy._prefetch_quizzes("Study note", 3) == [None, None, None]
+        assert "Batched quiz generation failed: boom" in caplog.text
+
+    @patch("builtins.input", side_effect=["2", "3"])
+    def test_interactive_session_regenerates_missing_questions(
+        self, mock_input, config, mock_search_tool, capsys
+    ):
+        """Test a session that prefetches, regenerates a failed slot, and grades both answers."""
+        buddy = SmartStudyBuddy(config=config, search_tool=mock_search_tool)
+        buddy.quiz_master = Mock()
+        buddy.quiz_master.run_async = AsyncMock(side_effect=[_VALID_QUIZ_JSON, "not json"])
+        buddy.quiz_master.run.return_value = _VALID_QUIZ_JSON
+        buddy.tutor = Mock()
+        buddy.tutor.run.return_value = "Well done"
+
+        with patch.object(buddy, "_generate_study_note", return_value="Study note"):
+            buddy.interactive_session("Math", questions=2)
+
+        buddy.quiz_master.run.assert_called_once()
+        assert "question 2 of 2" in buddy.quiz_master.run.call_args.args[0]
+        # Numeric picks are mapped straight to their option text
+        graded = [call.args[0] for call in buddy.tutor.run.call_args_list]
+        assert "Learner Answer: 4" in graded[0]
+        assert "Learner Answer: 5" in graded[1]
+        assert "Score: 1/2" in capsys.readouterr().out
+
+    def test_prefetch_quizzes_inside_running_loop(self, config, mock_search_tool):
+        """Test that prefetching defers to on-demand generation inside an event loop."""
+        buddy = SmartStudyBuddy(config=config, search_tool=mock_search_tool)
+        buddy.quiz_master = Mock()
+        buddy.quiz_master.run_async = AsyncMock(return_value=_VALID_QUIZ_JSON)
+
+        async def prefetch():
+            return buddy._prefetch_quizzes("Study note", 2)
+
+        with patch.object(SmartStudyBuddy, "_generate_quiz_batch") as mock_batch:
+            assert asyncio.run(prefetch()) == [None, None]
+        mock_batch.assert_not_called()
+        buddy.quiz_master.run_async.assert_not_awaited()
+
+
+class TestImports:
+    """Test module import side effects."""
+
+    def test_import_defers_heavy_sdks(self):
+        """Test that importing the module loads neither SDK (conftest stubs hide this in-process)."""
+        script = (
+            "import sys, smart_study_buddy; "
+            "print(sorted({'google.generativeai', 'duckduckgo_search'} & set(sys.modules)))"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", script],
+            cwd=Path(__file__).resolve().parent.parent,
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        assert result.stdout.strip() == "[]"